@@ -0,0 +1,44 @@
+"""One-shot conversion of the dashboard CSVs to Parquet.
+
+Run after changing anything in data/output_folder so deploys start from
+pre-typed columnar files instead of paying the CSV parse on first load:
+
+    python scripts/convert_to_parquet.py
+
+The app writes the same sidecars lazily via _load_or_convert; this script
+just builds all of them ahead of time and applies the one-off cleanups
+(stray apostrophes in the olim attempts counts, numeric sorted year).
+"""
+import glob
+import os
+
+import pandas as pd
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'output_folder')
+
+# Columns stored with stray apostrophes in the raw export
+QUOTED_COLS = ['ethiopia_since_1980', 'ussr_since_1990', 'other_immigrants']
+
+
+def convert(csv_path):
+    df = pd.read_csv(csv_path)
+    for col in QUOTED_COLS:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col].astype(str).str.strip("'"), errors='coerce').astype('float32')
+    if 'year' in df.columns:
+        df['year'] = pd.to_numeric(df['year'], errors='coerce')
+        df.dropna(subset=['year'], inplace=True)
+        df = df.sort_values('year')
+        df['year'] = df['year'].astype('int16')
+    parquet_path = os.path.splitext(csv_path)[0] + '.parquet'
+    df.to_parquet(parquet_path, compression='zstd')
+    return parquet_path
+
+
+def main():
+    for csv_path in sorted(glob.glob(os.path.join(DATA_DIR, '*.csv'))):
+        print('wrote', convert(csv_path))
+
+
+if __name__ == '__main__':
+    main()